@@ -4,19 +4,36 @@ Galveston County Court Document Scraper
 Standalone script for downloading court documents with 7-step navigation process
 """
 
+import argparse
 import time
+import hashlib
+import html
+import json
 import logging
 import re
 import os
+import shutil
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+import multiprocessing
+import multiprocessing.util
 import threading
 import queue
 
+# Optional faster parser for pages the regex fast path cannot handle
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 # Selenium imports
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -26,6 +43,148 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 
+# Seconds between WebDriverWait condition checks (Selenium defaults to 0.5)
+WAIT_POLL_FREQUENCY = 0.1
+
+# Expected case number format, e.g. 25-CV-0880
+CASE_NUMBER_RE = re.compile(r'^\d{2}-[A-Z]{2,3}-\d{3,5}\Z')
+
+# Characters that cannot appear in a case folder name, mapped to '_'
+PATH_SANITIZE = str.maketrans({c: '_' for c in '/\\:*?"<>|'})
+
+# Patterns used while parsing case pages and naming files
+_DATE_RE = re.compile(r'(\d{2})/(\d{2})/(\d{4})')
+_FRAGMENT_ID_RE = re.compile(r'DocumentFragmentID=(\d+)')
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+# Compiled once: every document link, and the first cell of a link's nearest row
+_DOCUMENT_LINKS_XPATH = etree.XPath("//a[contains(@href, 'ViewDocumentFragment.aspx')]")
+_ROW_FIRST_CELL_XPATH = etree.XPath("ancestor::tr[1]/td[1]")
+
+# Fast path for the court's plain document rows: a first cell holding only
+# text, then a document link before the row closes or a nested row opens
+# (a link inside a nested table belongs to the inner row, as in the parser)
+_DOCUMENT_ROW_RE = re.compile(
+    r'<tr[^>]*>\s*<td[^>]*>([^<]{0,200})</td>'
+    r'(?:(?!</?tr\b).)*?'
+    r'<a[^>]+href="([^"]*ViewDocumentFragment\.aspx[^"]*)"[^>]*>([^<]*)</a>',
+    re.DOTALL | re.IGNORECASE
+)
+_DOCUMENT_HREF_RE = re.compile(r'href\s*=\s*["\']?[^"\'>]*ViewDocumentFragment\.aspx', re.IGNORECASE)
+
+# Phrases in a non-PDF response that indicate a secured/protected document
+SECURED_INDICATORS = (
+    'access denied', 'access is denied', 'unauthorized', 'login required',
+    'authentication required', 'not authorized', 'permission denied',
+    'sealed', 'confidential', 'protected', 'restricted', 'private',
+    'secure', 'classified', 'redacted', 'impounded',
+    'court sealed', 'under seal', 'sealed by court',
+    'login to view', 'sign in required', 'authentication needed',
+    'forbidden', '401', '403', 'not permitted'
+)
+
+# Court-specific patterns that indicate a page comes from the court system
+COURT_INDICATORS = (
+    'publicaccess', 'galveston', 'court', 'justice', 'clerk',
+    'case', 'document', 'filing', 'docket'
+)
+
+# Additional patterns that suggest a secured/redirect page
+SECURED_PAGE_PATTERNS = (
+    'login', 'authentication', 'redirect', 'session', 'timeout',
+    'not authorized', 'restricted', 'unavailable', 'protected',
+    'not available', 'access denied', 'permission denied',
+    'this document is', 'cannot be displayed', 'cannot be viewed',
+    'error', 'expired', 'invalid request', 'forbidden'
+)
+
+# Markers of an HTML error page disguised as a PDF
+HTML_INDICATORS = ('<html', '<body', '<head', 'content-type: text/html', 'error', 'exception')
+# How much of a PDF is read before validation and scanned for those markers
+PDF_HEADER_SCAN_BYTES = 4096
+
+# The phrase lists as bytes, so a lowercased raw body is checked with
+# substring tests without decoding it first
+_SECURED_PHRASES = tuple(phrase.encode('ascii') for phrase in SECURED_INDICATORS)
+_COURT_PAGE_PHRASES = tuple(phrase.encode('ascii') for phrase in COURT_INDICATORS + SECURED_PAGE_PATTERNS)
+_HTML_PHRASES = tuple(phrase.encode('ascii') for phrase in HTML_INDICATORS)
+
+# Collects (absolute href, link text, first cell text) for every document link in the
+# browser. Text is gathered like _element_text: each text node stripped, then joined
+DOCUMENT_ROWS_SCRIPT = """
+const text = el => {
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    let result = '', node;
+    while ((node = walker.nextNode())) result += node.nodeValue.trim();
+    return result;
+};
+return Array.from(document.querySelectorAll('a[href*="ViewDocumentFragment.aspx"]')).map(a => {
+    const row = a.closest('tr');
+    const cell = row ? row.querySelector('td') : null;
+    return [a.href, text(a), cell ? text(cell) : null];
+});
+"""
+
+# Placeholder PDF written for secured documents. Everything before the page
+# content stream is fixed, so it is assembled once with its object offsets
+_PLACEHOLDER_PDF_OBJECTS = (
+    b"<<\n/Type /Catalog\n/Pages 2 0 R\n>>",
+    b"<<\n/Type /Pages\n/Kids [3 0 R]\n/Count 1\n>>",
+    b"<<\n/Type /Page\n/Parent 2 0 R\n/MediaBox [0 0 612 792]\n/Contents 4 0 R\n"
+    b"/Resources <<\n/Font <<\n/F1 <<\n/Type /Font\n/Subtype /Type1\n/BaseFont /Helvetica\n>>\n>>\n>>\n>>",
+)
+
+def _build_placeholder_pdf_prefix():
+    prefix = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(_PLACEHOLDER_PDF_OBJECTS, 1):
+        offsets.append(len(prefix))
+        prefix += b"%d 0 obj\n%s\nendobj\n\n" % (number, body)
+    return bytes(prefix), offsets
+
+_PLACEHOLDER_PDF_PREFIX, _placeholder_offsets = _build_placeholder_pdf_prefix()
+_PLACEHOLDER_PDF_STREAM = (
+    b"BT\n/F1 12 Tf\n50 700 Td\n(%s) Tj\n0 -20 Td\n(Filename: %s) Tj\n0 -20 Td\n"
+    b"(This document is not available for public access.) Tj\n0 -20 Td\n"
+    b"(Generated by Court Scraper on %s) Tj\nET"
+)
+# Offsets of the fixed objects are baked in; the content stream offset and startxref are filled per file
+_PLACEHOLDER_PDF_XREF = (
+    b"xref\n0 5\n0000000000 65535 f \n"
+    + b"".join(b"%010d 00000 n \n" % offset for offset in _placeholder_offsets)
+    + b"%010d 00000 n \ntrailer\n<<\n/Size 5\n/Root 1 0 R\n>>\nstartxref\n%d\n%%%%EOF"
+)
+
+def _pdf_string(text: str) -> bytes:
+    """Encode text for a PDF literal string, escaping delimiters"""
+    escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return escaped.encode('latin-1', errors='replace')
+
+# Checks run in the browser while waiting, so frequent polls do not transfer page_source
+NO_RECORDS_SCRIPT = "return document.documentElement.outerHTML.includes('No records found');"
+DOCUMENT_PAGE_READY_SCRIPT = (
+    "return document.documentElement.outerHTML.includes('ViewDocumentFragment.aspx') || "
+    "document.documentElement.outerHTML.includes('No records found');"
+)
+
+def _element_text(element) -> str:
+    """Join the stripped text nodes under an element, like BeautifulSoup's get_text(strip=True)"""
+    return "".join(text.strip() for text in element.itertext())
+
+# Download (connect, read) timeouts in seconds
+DOWNLOAD_TIMEOUT = (5, 60)
+
+# Streaming download buffer size
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Suffix of a PDF still being written
+PARTIAL_SUFFIX = ".part"
+# Per-case file remembering validators of failed responses and secured pages
+DOWNLOAD_CACHE_FILE = ".download_cache.json"
+# Downloaded chunks are gathered into this many bytes per write() call
+DOWNLOAD_WRITE_BUFFER = 4 * DOWNLOAD_CHUNK_SIZE
+# How much more of a non-PDF response is read and inspected after its head
+MAX_ERROR_PAGE_BYTES = 256 * 1024
+
 @dataclass
 class DocumentInfo:
     """Document information container"""
@@ -38,18 +197,22 @@ class DocumentInfo:
     doc_type: str
     size: int = 0
     status: str = "pending"
+    etag: str = ""
+    last_modified: str = ""
 
 class GalvestonCourtScraper:
     """Complete Galveston County court document scraper"""
     
-    def __init__(self, headless: bool = True, verbose: bool = False, progress_callback=None):
+    def __init__(self, headless: bool = True, verbose: bool = False, progress_callback=None, max_concurrent: int = 3):
         self.headless = headless
         self.verbose = verbose
+        self.max_concurrent = max_concurrent
         self.driver = None
+        self.keep_browser_open = False
         self.base_url = "https://publicaccess.galvestoncountytx.gov/PublicAccess/"
         self.documents = []
-        self.used_filenames = set()
         self.progress_callback = progress_callback
+        self._log_lock = threading.Lock()
         
         # Setup logging
         self.setup_logging()
@@ -62,7 +225,7 @@ class GalvestonCourtScraper:
             "Entering case number",
             "Clicking case number hyperlink (first time)",
             "Clicking case number hyperlink (second time) - CRUCIAL",
-            "Extracting HTML source with document links"
+            "Extracting document links"
         ]
     
     def setup_logging(self):
@@ -77,12 +240,14 @@ class GalvestonCourtScraper:
     
     def log(self, message: str, level: str = "INFO"):
         """Log a message"""
-        if self.verbose:
-            print(f"[{level}] {message}")
-        if level == "ERROR":
-            self.logger.error(message)
-        else:
-            self.logger.info(message)
+        # Download workers log concurrently; keep each message's lines together
+        with self._log_lock:
+            if self.verbose:
+                print(f"[{level}] {message}")
+            if level == "ERROR":
+                self.logger.error(message)
+            else:
+                self.logger.info(message)
     
     def report_progress(self, step: int, total_steps: int, message: str, phase: str = "navigation"):
         """Report progress to callback if available"""
@@ -102,7 +267,7 @@ class GalvestonCourtScraper:
             chrome_options = Options()
             
             if self.headless:
-                chrome_options.add_argument("--headless")
+                chrome_options.add_argument("--headless=new")
                 self.log("Starting browser in headless mode")
             else:
                 self.log("Starting browser in visible mode")
@@ -117,6 +282,21 @@ class GalvestonCourtScraper:
             chrome_options.add_argument("--disable-extensions")
             chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
             
+            # Skip work the scraper never needs: images, notification prompts and background Chrome services
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_argument("--disable-background-networking")
+            chrome_options.add_argument("--disable-sync")
+            chrome_options.add_argument("--disable-translate")
+            chrome_options.add_argument("--disable-default-apps")
+            chrome_options.add_argument("--no-first-run")
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
+            })
+            
+            # Return from driver.get() at DOMContentLoaded; each step waits for its own elements
+            chrome_options.page_load_strategy = 'eager'
+            
             # Create driver
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.set_page_load_timeout(30)
@@ -139,21 +319,57 @@ class GalvestonCourtScraper:
                 self.log(f"Error closing browser: {e}", "ERROR")
             self.driver = None
     
+    def start(self) -> bool:
+        """Launch the browser and keep it open across cases until stop() is called"""
+        self.keep_browser_open = True
+        if self.driver:
+            return True
+        return self.setup_driver()
+    
+    def stop(self):
+        """Close a browser kept open by start()"""
+        self.keep_browser_open = False
+        self.close_driver()
+    
+    def _is_driver_alive(self) -> bool:
+        """Check whether the browser process still responds"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+    
+    def _reset_driver(self):
+        """Reset browser state before a retry, relaunching only if the browser died"""
+        if self._is_driver_alive():
+            try:
+                self.driver.delete_all_cookies()
+                return
+            except WebDriverException as e:
+                self.log(f"Could not reset browser session: {e}", "ERROR")
+        self.close_driver()
+    
+    def _wait(self, timeout: float) -> WebDriverWait:
+        """Create a WebDriverWait that polls often enough to react quickly on fast connections"""
+        return WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+    
     def navigate_to_case(self, case_number: str, max_retries: int = 2) -> Optional[tuple]:
         """
-        Navigate through the 7-step process to get case documents HTML
+        Navigate through the 7-step process to get the case document links
         
         Args:
             case_number: Case number like '25-CV-0880'
             max_retries: Number of retry attempts if navigation fails
             
         Returns:
-            Tuple of (HTML source, cookies dict) or None if failed
+            Tuple of (document rows, cookies dict) or None if failed
         """
         for attempt in range(max_retries + 1):
             if attempt > 0:
                 self.log(f"Retry attempt {attempt} for case {case_number}")
-                self.close_driver()
+                self._reset_driver()
                 time.sleep(2)
             
             try:
@@ -180,7 +396,7 @@ class GalvestonCourtScraper:
         self.driver.get(f"{self.base_url}default.aspx")
         
         # Wait for page to load
-        WebDriverWait(self.driver, 15).until(
+        self._wait(15).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
         
@@ -188,13 +404,13 @@ class GalvestonCourtScraper:
         self.log(f"Step 2/7: {self.navigation_steps[1]}")
         self.report_progress(2, 7, self.navigation_steps[1])
         
-        civil_link = WebDriverWait(self.driver, 15).until(
+        civil_link = self._wait(15).until(
             EC.element_to_be_clickable((By.LINK_TEXT, "Civil and Family Case Records"))
         )
         civil_link.click()
         
         # Better wait for navigation instead of sleep
-        WebDriverWait(self.driver, 10).until(
+        self._wait(10).until(
             EC.presence_of_element_located((By.XPATH, "//input[@type='radio']"))
         )
         
@@ -202,19 +418,21 @@ class GalvestonCourtScraper:
         self.log(f"Step 3/7: {self.navigation_steps[2]}")
         self.report_progress(3, 7, self.navigation_steps[2])
         
-        case_radio = WebDriverWait(self.driver, 15).until(
+        case_radio = self._wait(15).until(
             EC.element_to_be_clickable((By.XPATH, "//input[@type='radio' and contains(@id, 'Case')]"))
         )
         case_radio.click()
         
         # Wait for form to update
-        time.sleep(1)
+        self._wait(5).until(
+            EC.visibility_of_element_located((By.ID, "CaseSearchValue"))
+        )
         
         # Step 4: Enter case number
         self.log(f"Step 4/7: {self.navigation_steps[3]} - {case_number}")
         self.report_progress(4, 7, f"{self.navigation_steps[3]} - {case_number}")
         
-        case_input = WebDriverWait(self.driver, 15).until(
+        case_input = self._wait(15).until(
             EC.element_to_be_clickable((By.ID, "CaseSearchValue"))
         )
         case_input.clear()
@@ -222,7 +440,7 @@ class GalvestonCourtScraper:
         case_input.send_keys(Keys.RETURN)
         
         # Wait for search results with better condition
-        WebDriverWait(self.driver, 15).until(
+        self._wait(15).until(
             EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, case_number))
         )
         
@@ -230,119 +448,128 @@ class GalvestonCourtScraper:
         self.log(f"Step 5/7: {self.navigation_steps[4]}")
         self.report_progress(5, 7, self.navigation_steps[4])
         
-        case_link = WebDriverWait(self.driver, 15).until(
+        case_link = self._wait(15).until(
             EC.element_to_be_clickable((By.PARTIAL_LINK_TEXT, case_number))
         )
         case_link.click()
         
         # Wait for case details page
-        WebDriverWait(self.driver, 10).until(
-            lambda driver: case_number in driver.page_source
+        self._wait(10).until(
+            lambda driver: driver.execute_script(
+                "return document.documentElement.outerHTML.includes(arguments[0]);", case_number
+            )
         )
         
         # Step 6: Click case number hyperlink again (CRUCIAL STEP)
         self.log(f"Step 6/7: {self.navigation_steps[5]}")
         self.report_progress(6, 7, self.navigation_steps[5])
         
-        case_link_second = WebDriverWait(self.driver, 15).until(
+        case_link_second = self._wait(15).until(
             EC.element_to_be_clickable((By.PARTIAL_LINK_TEXT, case_number))
         )
         case_link_second.click()
         
         # Wait for document list page - look for document indicators
-        WebDriverWait(self.driver, 15).until(
-            lambda driver: "ViewDocumentFragment.aspx" in driver.page_source or 
-                          "No records found" in driver.page_source
+        self._wait(15).until(
+            lambda driver: driver.execute_script(DOCUMENT_PAGE_READY_SCRIPT)
         )
         
-        # Step 7: Extract HTML source and cookies
+        # Step 7: Extract document links and cookies
         self.log(f"Step 7/7: {self.navigation_steps[6]}")
         self.report_progress(7, 7, self.navigation_steps[6])
         
-        html_source = self.driver.page_source
+        # Read the document rows straight from the browser DOM instead of
+        # serializing the whole page and parsing it again in Python
+        document_rows = [tuple(row) for row in self.driver.execute_script(DOCUMENT_ROWS_SCRIPT)]
         
-        # Extract cookies from the browser session
-        cookies = {}
-        for cookie in self.driver.get_cookies():
-            cookies[cookie['name']] = cookie['value']
+        # Extract cookies for the court site straight from Chrome's DevTools protocol
+        try:
+            browser_cookies = self.driver.execute_cdp_cmd(
+                'Network.getCookies', {'urls': [self.driver.current_url]}
+            )['cookies']
+        except WebDriverException:
+            browser_cookies = self.driver.get_cookies()
+        cookies = {cookie['name']: cookie['value'] for cookie in browser_cookies}
         
         self.log(f"Extracted {len(cookies)} cookies from browser session")
         
         # Validate we got the document page
-        if "ViewDocumentFragment.aspx" in html_source:
-            doc_count = len(re.findall(r'ViewDocumentFragment\.aspx', html_source))
-            self.log(f"Successfully extracted HTML with {doc_count} document links")
-            return (html_source, cookies)
-        elif "No records found" in html_source:
+        if document_rows:
+            self.log(f"Successfully extracted {len(document_rows)} document links")
+            return (document_rows, cookies)
+        elif self.driver.execute_script(NO_RECORDS_SCRIPT):
             self.log("Case found but no documents available")
-            return (html_source, cookies)
+            return (document_rows, cookies)
         else:
             raise Exception("Failed to reach document page - unexpected content")
     
-    def parse_documents(self, html_content: str) -> List[DocumentInfo]:
-        """Parse HTML content and extract document information"""
-        self.log("Parsing document information from HTML")
+    def parse_documents(self, page_content: Union[str, List[Tuple[str, str, Optional[str]]]]) -> List[DocumentInfo]:
+        """
+        Parse document information from a case page
         
-        soup = BeautifulSoup(html_content, 'html.parser')
-        documents = []
+        Args:
+            page_content: Raw HTML of the document list page, or the
+                (href, link text, first cell text) rows returned by navigate_to_case
         
-        # Find all document links
-        all_links = soup.find_all('a', href=lambda x: x and 'ViewDocumentFragment.aspx' in x)
+        Returns:
+            List of DocumentInfo for every dated document row
+        """
+        if isinstance(page_content, str):
+            self.log("Parsing document information from HTML")
+            document_rows = self._extract_document_rows(page_content)
+        else:
+            self.log("Parsing document information from page rows")
+            document_rows = page_content
+        
+        documents = []
         
-        if not all_links:
-            self.log("No document links found in HTML")
+        if not document_rows:
+            self.log("No document links found")
             return documents
         
-        self.log(f"Found {len(all_links)} document links")
+        self.log(f"Found {len(document_rows)} document links")
         
-        for i, link in enumerate(all_links, 1):
+        for i, (href, link_text, first_cell) in enumerate(document_rows, 1):
             try:
-                href = link.get('href')
-                link_text = link.get_text(strip=True)
                 fragment_id = self.extract_fragment_id(href)
                 
-                # Find the parent row to get date information
-                row = link.find_parent('tr')
-                if row:
-                    cells = row.find_all('td')
-                    if len(cells) >= 1:
-                        first_cell = cells[0].get_text(strip=True)
+                # The first cell of the parent row holds the date information
+                if first_cell is not None:
+                    # Look for date pattern MM/DD/YYYY
+                    date_match = _DATE_RE.search(first_cell)
+                    if date_match:
+                        month, day, year = date_match.groups()
+                        
+                        # Extract document type from date cell
+                        doc_type = first_cell[date_match.end():].strip()
+                        doc_type = doc_type.replace('\u00a0', ' ').replace('&nbsp;', ' ')
+                        doc_type = _WHITESPACE_RE.sub(' ', doc_type).strip()
+                        
+                        # Choose the longest, most descriptive name
+                        if len(link_text) > len(doc_type) and link_text != doc_type:
+                            display_name = link_text
+                        else:
+                            display_name = doc_type
+                        
+                        # Remove .pdf extension if already present
+                        if display_name.lower().endswith('.pdf'):
+                            display_name = display_name[:-4]
+                        
+                        # Generate unique filename
+                        filename = self.generate_unique_filename(year, month, day, display_name, fragment_id, href)
+                        
+                        doc_info = DocumentInfo(
+                            index=i,
+                            filename=filename,
+                            url=urljoin(self.base_url, href),
+                            fragment_id=fragment_id,
+                            date=f"{month}/{day}/{year}",
+                            display_name=display_name,
+                            doc_type=doc_type
+                        )
+                        
+                        documents.append(doc_info)
                         
-                        # Look for date pattern MM/DD/YYYY
-                        date_match = re.search(r'(\d{2})/(\d{2})/(\d{4})', first_cell)
-                        if date_match:
-                            month, day, year = date_match.groups()
-                            
-                            # Extract document type from date cell
-                            doc_type = first_cell[date_match.end():].strip()
-                            doc_type = doc_type.replace('\u00a0', ' ').replace('&nbsp;', ' ')
-                            doc_type = re.sub(r'\s+', ' ', doc_type).strip()
-                            
-                            # Choose the longest, most descriptive name
-                            if len(link_text) > len(doc_type) and link_text != doc_type:
-                                display_name = link_text
-                            else:
-                                display_name = doc_type
-                            
-                            # Remove .pdf extension if already present
-                            if display_name.lower().endswith('.pdf'):
-                                display_name = display_name[:-4]
-                            
-                            # Generate unique filename
-                            filename = self.generate_unique_filename(year, month, day, display_name, fragment_id)
-                            
-                            doc_info = DocumentInfo(
-                                index=i,
-                                filename=filename,
-                                url=href,
-                                fragment_id=fragment_id,
-                                date=f"{month}/{day}/{year}",
-                                display_name=display_name,
-                                doc_type=doc_type
-                            )
-                            
-                            documents.append(doc_info)
-                            
             except Exception as e:
                 self.log(f"Error parsing document {i}: {e}", "ERROR")
                 continue
@@ -350,41 +577,89 @@ class GalvestonCourtScraper:
         self.log(f"Successfully parsed {len(documents)} documents")
         return documents
     
+    def _extract_document_rows(self, html_content: str) -> List[Tuple[str, str, Optional[str]]]:
+        """Extract (href, link text, first cell text) for each document link in raw HTML"""
+        # The court's row template is static, so a regex usually finds every
+        # link without building a tree; fall back to lxml if it misses any
+        document_rows = [
+            (html.unescape(href), html.unescape(link_text).strip(), html.unescape(first_cell).strip())
+            for first_cell, href, link_text in _DOCUMENT_ROW_RE.findall(html_content)
+        ]
+        if document_rows and len(document_rows) == len(_DOCUMENT_HREF_RE.findall(html_content)):
+            # Shadow-run the parser in verbose mode so layouts the regex misreads show up in the log
+            if self.verbose:
+                parsed_rows = self._parse_document_rows(html_content)
+                if parsed_rows != document_rows:
+                    self.log("Regex row extraction differs from the HTML parser, using the parser", "WARNING")
+                    return parsed_rows
+            return document_rows
+        
+        if not html_content.strip():
+            return []
+        
+        return self._parse_document_rows(html_content)
+    
+    def _parse_document_rows(self, html_content: str) -> List[Tuple[str, str, Optional[str]]]:
+        """Extract document rows by building a tree, with selectolax when installed, otherwise lxml"""
+        if LexborHTMLParser is not None:
+            return self._extract_document_rows_lexbor(html_content)
+        
+        tree = lxml_html.fromstring(html_content)
+        document_rows = []
+        
+        # Find all document links
+        for link in _DOCUMENT_LINKS_XPATH(tree):
+            # The first cell of the parent row holds the date information
+            cells = _ROW_FIRST_CELL_XPATH(link)
+            first_cell = _element_text(cells[0]) if cells else None
+            
+            document_rows.append((link.get('href'), _element_text(link), first_cell))
+        
+        return document_rows
+    
+    def _extract_document_rows_lexbor(self, html_content: str) -> List[Tuple[str, str, Optional[str]]]:
+        """Same as the lxml path of _parse_document_rows, using selectolax"""
+        tree = LexborHTMLParser(html_content)
+        document_rows = []
+        
+        for link in tree.css("a[href*='ViewDocumentFragment.aspx']"):
+            # The first cell of the parent row holds the date information
+            row = link.parent
+            while row is not None and row.tag != 'tr':
+                row = row.parent
+            cell = next((child for child in row.iter() if child.tag == 'td'), None) if row is not None else None
+            first_cell = cell.text(strip=True) if cell is not None else None
+            
+            document_rows.append((link.attributes.get('href'), link.text(strip=True), first_cell))
+        
+        return document_rows
+    
     def extract_fragment_id(self, url: str) -> str:
         """Extract DocumentFragmentID from URL"""
-        match = re.search(r'DocumentFragmentID=(\d+)', url)
+        match = _FRAGMENT_ID_RE.search(url)
         return match.group(1) if match else "unknown"
     
     def sanitize_filename(self, filename: str, max_length: int = 120) -> str:
         """Sanitize filename by removing invalid characters"""
-        invalid_chars = r'[<>:"/\\|?*]'
-        filename = re.sub(invalid_chars, '', filename)
-        filename = re.sub(r'\s+', ' ', filename).strip()
+        filename = _INVALID_CHARS_RE.sub('', filename)
+        filename = _WHITESPACE_RE.sub(' ', filename).strip()
         
         if len(filename) > max_length - 4:
             filename = filename[:max_length - 4]
         
         return filename
     
-    def generate_unique_filename(self, year: str, month: str, day: str, display_name: str, fragment_id: str) -> str:
-        """Generate guaranteed unique filename"""
+    def generate_unique_filename(self, year: str, month: str, day: str, display_name: str, fragment_id: str,
+                                 href: str = "") -> str:
+        """Generate filename made unique by the server-assigned DocumentFragmentID"""
         sanitized_name = self.sanitize_filename(display_name)
-        base_filename = f"{year}.{month}.{day}_{sanitized_name}"
-        final_filename = f"{base_filename}.pdf"
         
-        # Check for duplicates and make unique if needed
-        counter = 1
-        while final_filename in self.used_filenames:
-            final_filename = f"{base_filename}_(ID{fragment_id}).pdf"
-            
-            if final_filename in self.used_filenames:
-                final_filename = f"{base_filename}_(ID{fragment_id})_{counter}.pdf"
-                counter += 1
-            else:
-                break
+        # Without an ID, a hash of the link keeps same-day documents of the same
+        # name apart and stays stable across runs
+        if fragment_id == "unknown":
+            fragment_id = f"unknown-{hashlib.sha1(href.encode('utf-8')).hexdigest()[:8]}"
         
-        self.used_filenames.add(final_filename)
-        return final_filename
+        return f"{year}.{month}.{day}_{sanitized_name}_{fragment_id}.pdf"
     
     def _validate_pdf_content(self, content: bytes, filename: str) -> str:
         """
@@ -395,180 +670,76 @@ class GalvestonCourtScraper:
             'secured' - Content indicates secured/protected document
             'error' - Invalid content or error page
         """
+        is_pdf = content.startswith(b'%PDF-')
+        
+        # An error page served with PDF magic bytes shows it in the header, so
+        # only the start of a PDF is inspected; other responses are small pages.
+        # The text is lowercased once and each phrase list checked only when needed
+        text = (content[:PDF_HEADER_SCAN_BYTES] if is_pdf else content).lower()
+        
         # Check minimum size (PDFs should be at least 1KB for real documents)
         if len(content) < 1024:
             # Very small files are often error pages, check if they're secured
-            if len(content) > 0:
-                content_str = content.decode('utf-8', errors='ignore').lower()
-                if self._is_secured_content(content_str):
-                    self.log(f"SECURED: {filename} - Access denied ({len(content)} bytes)")
-                    return 'secured'
-            
-            self.log(f"Content too small for {filename}: {len(content)} bytes", "ERROR")
-            return 'error'
-        
-        # Check PDF magic bytes (PDFs start with %PDF-)
-        if not content.startswith(b'%PDF-'):
-            # Not a PDF, check if it's a secured document indicator
-            content_str = content.decode('utf-8', errors='ignore').lower()
-            
-            # Check for explicit secured content first
-            if self._is_secured_content(content_str):
-                self.log(f"SECURED: {filename} - Access denied or login required")
+            if self._is_secured_content(text):
+                self.log(f"SECURED: {filename} - Access denied ({len(content)} bytes)")
                 return 'secured'
             
-            # Check if it's a court system secured page (common for family cases)  
-            if self._is_likely_court_secured_page(content_str):
-                self.log(f"SECURED: {filename} - Court HTML page instead of PDF (likely protected)")
-                return 'secured'
-            
-            self.log(f"Content not PDF format for {filename} (starts with: {content[:20]})", "ERROR")
+            self.log(f"Content too small for {filename}: {len(content)} bytes", "ERROR")
             return 'error'
         
         # Check for common HTML error indicators in what appears to be a PDF
-        content_str = content.decode('utf-8', errors='ignore').lower()
-        html_indicators = ['<html', '<body', '<head', 'content-type: text/html', 'error', 'exception']
-        if any(indicator in content_str for indicator in html_indicators):
-            # Check if it's explicitly a secured document
-            if self._is_secured_content(content_str):
-                self.log(f"SECURED: {filename} - Access denied or login required")
-                return 'secured'
-            
-            # For court documents, HTML pages instead of PDFs often indicate secured/protected content
-            # Especially in family cases where sensitive information is involved
-            if self._is_likely_court_secured_page(content_str):
-                self.log(f"SECURED: {filename} - Court HTML page instead of PDF (likely protected)")
-                return 'secured'
-            
-            self.log(f"Content appears to be HTML error page for {filename}", "ERROR")
-            return 'error'
-        
-        return 'valid'
-    
-    def _is_secured_content(self, content_str: str) -> bool:
-        """Check if content indicates a secured/protected document"""
-        secured_indicators = [
-            'access denied', 'access is denied', 'unauthorized', 'login required',
-            'authentication required', 'not authorized', 'permission denied',
-            'sealed', 'confidential', 'protected', 'restricted', 'private',
-            'secure', 'classified', 'redacted', 'impounded',
-            'court sealed', 'under seal', 'sealed by court',
-            'login to view', 'sign in required', 'authentication needed',
-            'forbidden', '401', '403', 'not permitted'
-        ]
-        
-        return any(indicator in content_str for indicator in secured_indicators)
-    
-    def _is_likely_court_secured_page(self, content_str: str) -> bool:
-        """Check if HTML content is likely a court system secured page"""
-        # Look for court-specific patterns that indicate this is from the court system
-        court_indicators = [
-            'publicaccess', 'galveston', 'court', 'justice', 'clerk',
-            'case', 'document', 'filing', 'docket'
-        ]
+        if is_pdf and not any(marker in text for marker in _HTML_PHRASES):
+            return 'valid'
         
-        # Must be from court system AND be an HTML page when we expected PDF
-        has_court_context = any(indicator in content_str for indicator in court_indicators)
+        # Check for explicit secured content first
+        if self._is_secured_content(text):
+            self.log(f"SECURED: {filename} - Access denied or login required")
+            return 'secured'
         
-        # Additional patterns that suggest this is a secured/redirect page
-        secured_patterns = [
-            'login', 'authentication', 'redirect', 'session', 'timeout',
-            'not authorized', 'restricted', 'unavailable', 'protected',
-            'not available', 'access denied', 'permission denied',
-            'this document is', 'cannot be displayed', 'cannot be viewed',
-            'error', 'expired', 'invalid request', 'forbidden'
-        ]
-        
-        has_secured_pattern = any(pattern in content_str for pattern in secured_patterns)
+        # For court documents, HTML pages instead of PDFs often indicate secured/protected content
+        # Especially in family cases where sensitive information is involved
+        if self._is_likely_court_secured_page(text):
+            self.log(f"SECURED: {filename} - Court HTML page instead of PDF (likely protected)")
+            return 'secured'
         
-        # If it's clearly from the court system and we got HTML instead of PDF,
-        # it's likely a secured document (especially common in family cases)
-        # Family courts often protect sensitive documents by default
-        return has_court_context or has_secured_pattern
+        if is_pdf:
+            self.log(f"Content appears to be HTML error page for {filename}", "ERROR")
+        else:
+            self.log(f"Content not PDF format for {filename} (starts with: {content[:20]})", "ERROR")
+        return 'error'
+    
+    def _is_secured_content(self, text: bytes) -> bool:
+        """Check if lowercased content indicates a secured/protected document"""
+        return any(indicator in text for indicator in _SECURED_PHRASES)
+    
+    def _is_likely_court_secured_page(self, text: bytes) -> bool:
+        """Check if lowercased HTML content is likely a court system secured page"""
+        # If it's clearly from the court system or looks like a secured/redirect
+        # page and we got HTML instead of PDF, it's likely a secured document
+        # (especially common in family cases)
+        return any(pattern in text for pattern in _COURT_PAGE_PHRASES)
     
     def _create_placeholder_pdf(self, file_path: Path, filename: str, reason: str = "Document Secured/Sealed"):
         """Create a placeholder PDF for secured documents"""
         try:
-            # Simple PDF content indicating secured document
-            pdf_content = f"""%PDF-1.4
-1 0 obj
-<<
-/Type /Catalog
-/Pages 2 0 R
->>
-endobj
-
-2 0 obj
-<<
-/Type /Pages
-/Kids [3 0 R]
-/Count 1
->>
-endobj
-
-3 0 obj
-<<
-/Type /Page
-/Parent 2 0 R
-/MediaBox [0 0 612 792]
-/Contents 4 0 R
-/Resources <<
-/Font <<
-/F1 <<
-/Type /Font
-/Subtype /Type1
-/BaseFont /Helvetica
->>
->>
->>
->>
-endobj
-
-4 0 obj
-<<
-/Length 200
->>
-stream
-BT
-/F1 12 Tf
-50 700 Td
-({reason}) Tj
-0 -20 Td
-(Filename: {filename}) Tj
-0 -20 Td
-(This document is not available for public access.) Tj
-0 -20 Td
-(Generated by Court Scraper on {time}) Tj
-ET
-endstream
-endobj
-
-xref
-0 5
-0000000000 65535 f 
-0000000009 00000 n 
-0000000058 00000 n 
-0000000115 00000 n 
-0000000376 00000 n 
-trailer
-<<
-/Size 5
-/Root 1 0 R
->>
-startxref
-626
-%%EOF"""
-            
-            # Format the PDF content with actual values
-            formatted_content = pdf_content.format(
-                reason=reason,
-                filename=filename,
-                time=time.strftime('%Y-%m-%d %H:%M:%S')
+            # Page text stream indicating secured document
+            stream = _PLACEHOLDER_PDF_STREAM % (
+                _pdf_string(reason),
+                _pdf_string(filename),
+                _pdf_string(time.strftime('%Y-%m-%d %H:%M:%S'))
             )
             
-            # Write placeholder PDF
-            with open(file_path, 'wb') as f:
-                f.write(formatted_content.encode('utf-8'))
+            # The content stream is the last object, so only its length and the
+            # cross-reference table trailing it vary between placeholders
+            contents_object = b"4 0 obj\n<<\n/Length %d\n>>\nstream\n%s\nendstream\nendobj\n\n" % (len(stream), stream)
+            xref_offset = len(_PLACEHOLDER_PDF_PREFIX) + len(contents_object)
+            xref = _PLACEHOLDER_PDF_XREF % (len(_PLACEHOLDER_PDF_PREFIX), xref_offset)
+            
+            # Write placeholder PDF through a .part file like a downloaded PDF
+            part_path = file_path.with_name(file_path.name + PARTIAL_SUFFIX)
+            with open(part_path, 'wb') as f:
+                f.write(b"".join((_PLACEHOLDER_PDF_PREFIX, contents_object, xref)))
+            os.replace(part_path, file_path)
             
             return True
             
@@ -576,9 +747,55 @@ startxref
             self.log(f"Failed to create placeholder PDF for {filename}: {e}", "ERROR")
             return False
     
-    def _download_with_retry(self, session, doc: DocumentInfo, file_path: Path, max_retries: int = 2) -> str:
+    def _is_placeholder(self, file_path: Path) -> bool:
+        """Check whether a file on disk is a placeholder written for a secured document"""
+        try:
+            with open(file_path, 'rb') as f:
+                return f.read(len(_PLACEHOLDER_PDF_PREFIX)) == _PLACEHOLDER_PDF_PREFIX
+        except OSError:
+            return False
+    
+    def _keep_existing_file(self, file_path: Path, doc: DocumentInfo) -> Optional[str]:
+        """
+        Result for a secured response when a copy is already on disk
+        
+        Only a valid PDF may replace an existing file, so a secured page never
+        overwrites a real PDF (e.g. after the session expired) and an existing
+        placeholder is left as it is.
+        
+        Returns:
+            None when nothing is on disk, otherwise 'secured' or 'skipped'
+        """
+        if not file_path.exists():
+            return None
+        if self._is_placeholder(file_path):
+            self.log(f"SECURED: {doc.filename} - still secured, keeping existing placeholder")
+            return 'secured'
+        self.log(f"KEPT: {doc.filename} - server returned a secured page, keeping the existing PDF", "WARNING")
+        return 'skipped'
+    
+    def _read_head(self, raw, size: int = PDF_HEADER_SCAN_BYTES) -> bytes:
+        """Read up to size bytes from a raw response stream, stopping early only at EOF"""
+        head = b''
+        while len(head) < size:
+            chunk = raw.read(size - len(head))
+            if not chunk:
+                break
+            head += chunk
+        return head
+    
+    def _download_with_retry(self, session, doc: DocumentInfo, file_path: Path, max_retries: int = 2,
+                             cached: Optional[dict] = None) -> str:
         """Download a single document with retry mechanism"""
-        url = urljoin(self.base_url, doc.url)
+        url = doc.url
+        
+        # Revalidate a response that failed last run so the server can answer 304 without a body
+        headers = {}
+        if cached and cached.get('status') == 'failed':
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
         
         for attempt in range(max_retries + 1):
             try:
@@ -588,56 +805,86 @@ startxref
                 else:
                     self.log(f"Downloading: {doc.filename}")
                 
-                # Download file
-                response = session.get(url, timeout=30)
-                
-                if response.status_code == 200:
-                    content_length = len(response.content)
+                # Stream the file so only a small buffer is held in memory
+                with session.get(url, headers=headers, timeout=DOWNLOAD_TIMEOUT, stream=True) as response:
+                    doc.etag = response.headers.get('ETag', headers.get('If-None-Match', ''))
+                    doc.last_modified = response.headers.get('Last-Modified', headers.get('If-Modified-Since', ''))
+                    doc.size = int(response.headers.get('Content-Length') or (cached or {}).get('size', 0))
                     
-                    # Validate content and determine status
-                    validation_result = self._validate_pdf_content(response.content, doc.filename)
+                    if response.status_code == 304:
+                        self.log(f"UNCHANGED: {doc.filename} - same invalid response as last run, not retrying", "ERROR")
+                        return 'failed'
                     
-                    if validation_result == 'valid':
-                        # Save valid PDF file
-                        with open(file_path, 'wb') as file:
-                            file.write(response.content)
+                    if response.status_code == 200:
+                        response.raw.decode_content = True
+                        content = self._read_head(response.raw)
+                        
+                        # Error and secured pages are small HTML documents, inspect them whole
+                        if not content.startswith(b'%PDF-'):
+                            content += response.raw.read(MAX_ERROR_PAGE_BYTES)
+                        
+                        # Validate content and determine status
+                        validation_result = self._validate_pdf_content(content, doc.filename)
+                        
+                        if validation_result == 'valid':
+                            # Save valid PDF file through a .part file, so neither a failed
+                            # copy nor a refresh of a changed document leaves a broken file
+                            part_path = file_path.with_name(file_path.name + PARTIAL_SUFFIX)
+                            with open(part_path, 'wb', buffering=DOWNLOAD_WRITE_BUFFER) as file:
+                                try:
+                                    file.write(content)
+                                    shutil.copyfileobj(response.raw, file, length=DOWNLOAD_CHUNK_SIZE)
+                                    content_length = file.tell()
+                                except BaseException:
+                                    file.close()
+                                    part_path.unlink()
+                                    raise
+                            os.replace(part_path, file_path)
+                            
+                            self.log(f"SUCCESS: {doc.filename} ({content_length:,} bytes)")
+                            return 'success'
+                        
+                        elif validation_result == 'secured':
+                            existing_result = self._keep_existing_file(file_path, doc)
+                            if existing_result:
+                                return existing_result
+                            
+                            # Create placeholder for secured document
+                            if self._create_placeholder_pdf(file_path, doc.filename):
+                                self.log(f"PLACEHOLDER: {doc.filename} - Created placeholder for secured document")
+                                return 'secured'
+                            else:
+                                self.log(f"FAILED: {doc.filename} - Could not create placeholder", "ERROR")
+                                return 'failed'
+                        
+                        elif validation_result == 'error':
+                            if attempt == max_retries:
+                                self.log(f"FAILED: {doc.filename} - Invalid PDF content after all retries", "ERROR")
+                                return 'failed'
+                            else:
+                                self.log(f"Invalid content on attempt {attempt + 1}, retrying...", "WARNING")
+                                continue
+                    else:
+                        # Check for HTTP status codes that indicate secured files
+                        if response.status_code in [401, 403]:
+                            # Unauthorized or Forbidden - likely secured document
+                            existing_result = self._keep_existing_file(file_path, doc)
+                            if existing_result:
+                                return existing_result
+                            
+                            if self._create_placeholder_pdf(file_path, doc.filename, f"HTTP {response.status_code} - Access Denied"):
+                                self.log(f"SECURED: {doc.filename} - HTTP {response.status_code}, created placeholder")
+                                return 'secured'
+                            else:
+                                self.log(f"FAILED: {doc.filename} - HTTP {response.status_code}, could not create placeholder", "ERROR")
+                                return 'failed'
                         
-                        self.log(f"SUCCESS: {doc.filename} ({content_length:,} bytes)")
-                        return 'success'
-                    
-                    elif validation_result == 'secured':
-                        # Create placeholder for secured document
-                        if self._create_placeholder_pdf(file_path, doc.filename):
-                            self.log(f"PLACEHOLDER: {doc.filename} - Created placeholder for secured document")
-                            return 'secured'
-                        else:
-                            self.log(f"FAILED: {doc.filename} - Could not create placeholder", "ERROR")
-                            return 'failed'
-                    
-                    elif validation_result == 'error':
                         if attempt == max_retries:
-                            self.log(f"FAILED: {doc.filename} - Invalid PDF content after all retries", "ERROR")
+                            self.log(f"FAILED: {doc.filename} - HTTP {response.status_code} after all retries", "ERROR")
                             return 'failed'
                         else:
-                            self.log(f"Invalid content on attempt {attempt + 1}, retrying...", "WARNING")
+                            self.log(f"HTTP {response.status_code} on attempt {attempt + 1}, retrying...")
                             continue
-                else:
-                    # Check for HTTP status codes that indicate secured files
-                    if response.status_code in [401, 403]:
-                        # Unauthorized or Forbidden - likely secured document
-                        if self._create_placeholder_pdf(file_path, doc.filename, f"HTTP {response.status_code} - Access Denied"):
-                            self.log(f"SECURED: {doc.filename} - HTTP {response.status_code}, created placeholder")
-                            return 'secured'
-                        else:
-                            self.log(f"FAILED: {doc.filename} - HTTP {response.status_code}, could not create placeholder", "ERROR")
-                            return 'failed'
-                    
-                    if attempt == max_retries:
-                        self.log(f"FAILED: {doc.filename} - HTTP {response.status_code} after all retries", "ERROR")
-                        return 'failed'
-                    else:
-                        self.log(f"HTTP {response.status_code} on attempt {attempt + 1}, retrying...")
-                        continue
                         
             except Exception as e:
                 if attempt == max_retries:
@@ -649,20 +896,92 @@ startxref
         
         return 'failed'
     
-    def download_documents(self, documents: List[DocumentInfo], download_dir: Path, cookies: dict = None, max_concurrent: int = 3) -> Dict:
-        """Download all documents with concurrent downloading"""
-        if not documents:
-            self.log("No documents to download")
-            return {"successful": 0, "failed": 0, "skipped": 0, "secured": 0}
+    def _download_one(self, get_session, doc: DocumentInfo, download_dir: Path, cached: Optional[dict] = None) -> str:
+        """
+        Download one document on a worker thread
         
-        download_dir.mkdir(parents=True, exist_ok=True)
-        self.log(f"Starting download of {len(documents)} documents to {download_dir}")
+        Returns:
+            Result category: 'successful', 'secured', 'failed' or 'skipped'
+        """
+        file_path = download_dir / doc.filename
         
-        # Report initial download progress
-        self.report_progress(0, len(documents), f"Preparing to download {len(documents)} documents", "download")
+        # Skip if file already exists, unless the server now reports a different document
+        if file_path.exists():
+            existing_size = file_path.stat().st_size
+            if not self._has_changed_on_server(get_session(), doc, file_path, existing_size, cached):
+                self.log(f"SKIP: {doc.filename} (exists, {existing_size:,} bytes)")
+                return 'skipped'
+            self.log(f"CHANGED: {doc.filename} - server copy differs from the one on disk, downloading again")
+        
+        download_result = self._download_with_retry(get_session(), doc, file_path, max_retries=2, cached=cached)
+        
+        if download_result == 'success':
+            return 'successful'
+        elif download_result in ('secured', 'skipped'):
+            return download_result
+        else:  # 'failed'
+            return 'failed'
+    
+    def _has_changed_on_server(self, session, doc: DocumentInfo, file_path: Path, existing_size: int,
+                               cached: Optional[dict] = None) -> bool:
+        """
+        Check a HEAD response against the copy saved last time
         
-        # Setup session for downloads
+        Real PDFs compare Content-Length with the file on disk. Secured pages are
+        dynamic HTML whose length varies between requests, so placeholders compare
+        the ETag/Last-Modified recorded in the download cache instead. Any doubt
+        (HEAD unsupported, no length or validators) counts as unchanged.
+        """
+        # Only send the HEAD when its answer can be compared with something
+        is_placeholder = self._is_placeholder(file_path)
+        if is_placeholder and not (cached and (cached.get('etag') or cached.get('last_modified'))):
+            return False
+        
+        try:
+            response = session.head(doc.url, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT)
+        except requests.RequestException:
+            return False
+        
+        if not response.ok:
+            return False
+        
+        if is_placeholder:
+            etag = response.headers.get('ETag')
+            if cached.get('etag') and etag:
+                return etag != cached['etag']
+            last_modified = response.headers.get('Last-Modified')
+            if cached.get('last_modified') and last_modified:
+                return last_modified != cached['last_modified']
+            return False
+        
+        content_length = response.headers.get('Content-Length')
+        if not content_length:
+            return False
+        
+        doc.size = int(content_length)
+        return doc.size != existing_size
+    
+    def _create_session(self, cookies: dict = None, pool_size: int = 3) -> requests.Session:
+        """Create an HTTP session carrying the browser cookies for document downloads"""
         session = requests.Session()
+        
+        # Keep connections to the court server alive between documents so each
+        # download reuses an open TCP/TLS connection instead of handshaking again.
+        # Connection failures and gateway errors are retried here with backoff
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size * 2,
+            max_retries=Retry(
+                total=3,
+                read=False,
+                status_forcelist=[502, 503, 504],
+                backoff_factor=0.5,
+                raise_on_status=False
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        
         session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
@@ -671,72 +990,157 @@ startxref
         # Add cookies from browser session if provided
         if cookies:
             session.cookies.update(cookies)
-            self.log(f"Added {len(cookies)} cookies to download session")
         
         # Disable SSL verification for problematic certificates
         session.verify = False
+        return session
+    
+    def download_documents(self, documents: List[DocumentInfo], download_dir: Path, cookies: dict = None, max_concurrent: int = 3) -> Dict:
+        """Download all documents with concurrent downloading"""
+        if not documents:
+            self.log("No documents to download")
+            return {"successful": 0, "failed": 0, "skipped": 0, "secured": 0}
+        
+        # The page can link the same document twice; download each one once. Links
+        # are keyed by fragment ID, or by URL when the link has no ID, never by
+        # filename, so distinct documents that share a name are all kept
+        unique_documents = {}
+        for doc in documents:
+            unique_documents.setdefault(doc.url if doc.fragment_id == "unknown" else doc.fragment_id, doc)
+        if len(unique_documents) < len(documents):
+            self.log(f"Ignoring {len(documents) - len(unique_documents)} duplicate document links")
+            documents = list(unique_documents.values())
+        
+        download_dir.mkdir(parents=True, exist_ok=True)
+        self._remove_partial_downloads(download_dir)
+        self.log(f"Starting download of {len(documents)} documents to {download_dir}")
+        
+        # Report initial download progress
+        self.report_progress(0, len(documents), f"Preparing to download {len(documents)} documents", "download")
+        
+        if cookies:
+            self.log(f"Adding {len(cookies)} cookies to download sessions")
+        
         import urllib3
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         
-        successful = 0
-        failed = 0
-        skipped = 0
-        secured = 0
+        # requests.Session is not thread-safe, so each worker thread gets its own
+        thread_local = threading.local()
+        sessions = []
         
-        for doc_index, doc in enumerate(documents, 1):
-            try:
-                file_path = download_dir / doc.filename
-                
-                # Report progress for current document
-                self.report_progress(doc_index, len(documents), f"Processing: {doc.filename}", "download")
-                
-                # Skip if file already exists
-                if file_path.exists():
-                    existing_size = file_path.stat().st_size
-                    self.log(f"SKIP: {doc.filename} (exists, {existing_size:,} bytes)")
-                    skipped += 1
-                    continue
-                
-                # Try downloading with retry mechanism
-                download_result = self._download_with_retry(session, doc, file_path, max_retries=2)
-                
-                if download_result == 'success':
-                    successful += 1
-                elif download_result == 'secured':
-                    secured += 1
-                else:  # 'failed'
-                    failed += 1
-                
-                # Respectful delay
-                time.sleep(1.0)
+        def get_session() -> requests.Session:
+            session = getattr(thread_local, 'session', None)
+            if session is None:
+                session = self._create_session(cookies, pool_size=max_concurrent)
+                thread_local.session = session
+                sessions.append(session)
+            return session
+        
+        cache = self._load_download_cache(download_dir)
+        counts = {"successful": 0, "failed": 0, "skipped": 0, "secured": 0}
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_concurrent)) as executor:
+                futures = {
+                    executor.submit(self._download_one, get_session, doc, download_dir, cache.get(doc.fragment_id)): doc
+                    for doc in documents
+                }
                 
-            except Exception as e:
-                self.log(f"ERROR downloading {doc.filename}: {str(e)}", "ERROR")
-                failed += 1
+                # Results are tallied here as workers finish, so progress ticks per completed document
+                for completed, future in enumerate(as_completed(futures), 1):
+                    doc = futures[future]
+                    try:
+                        doc.status = future.result()
+                    except Exception as e:
+                        self.log(f"ERROR downloading {doc.filename}: {str(e)}", "ERROR")
+                        doc.status = "failed"
+                    
+                    counts[doc.status] += 1
+                    self.report_progress(completed, len(documents), f"Processed: {doc.filename}", "download")
+        finally:
+            for session in sessions:
+                session.close()
+        
+        # Remember validators for documents that failed so the next run can skip
+        # refetching a response the server reports as unchanged, and for secured
+        # placeholders so reruns can tell if the document behind them changed
+        # Documents without an ID cannot be told apart in the cache, so none is kept for them
+        for doc in documents:
+            if doc.fragment_id == "unknown":
+                cache.pop(doc.fragment_id, None)
+            elif doc.status in ("secured", "failed") and (doc.etag or doc.last_modified):
+                cache[doc.fragment_id] = {
+                    'etag': doc.etag,
+                    'last_modified': doc.last_modified,
+                    'size': doc.size,
+                    'status': doc.status
+                }
+            elif doc.status != "skipped":
+                cache.pop(doc.fragment_id, None)
+        self._save_download_cache(download_dir, cache)
         
-        self.log(f"Download complete: {successful} successful, {secured} secured, {failed} failed, {skipped} skipped")
-        return {"successful": successful, "failed": failed, "skipped": skipped, "secured": secured}
+        self.log(f"Download complete: {counts['successful']} successful, {counts['secured']} secured, "
+                 f"{counts['failed']} failed, {counts['skipped']} skipped")
+        return counts
+    
+    def _remove_partial_downloads(self, download_dir: Path):
+        """Delete .part files left behind by an interrupted earlier run"""
+        with os.scandir(download_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(PARTIAL_SUFFIX):
+                    os.unlink(entry.path)
+    
+    def _load_download_cache(self, download_dir: Path) -> Dict[str, dict]:
+        """Load cached response validators for documents in a download directory"""
+        cache_file = download_dir / DOWNLOAD_CACHE_FILE
+        try:
+            if cache_file.exists():
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except (OSError, ValueError) as e:
+            self.log(f"Ignoring unreadable download cache: {e}", "ERROR")
+        return {}
+    
+    def _save_download_cache(self, download_dir: Path, cache: Dict[str, dict]):
+        """Persist cached response validators, removing the file when nothing is cached"""
+        cache_file = download_dir / DOWNLOAD_CACHE_FILE
+        try:
+            if cache:
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f, indent=2)
+            elif cache_file.exists():
+                cache_file.unlink()
+        except OSError as e:
+            self.log(f"Could not save download cache: {e}", "ERROR")
     
     def create_manifest(self, download_dir: Path) -> Path:
         """Create detailed manifest of downloaded files"""
-        pdf_files = sorted(download_dir.glob("*.pdf"))
+        # One directory scan collecting each PDF's name and size; the entry type
+        # comes from readdir, so directories are skipped without a stat call
+        with os.scandir(download_dir) as entries:
+            pdf_files = sorted(
+                (entry.name, entry.stat(follow_symlinks=False).st_size)
+                for entry in entries
+                if entry.name.lower().endswith('.pdf') and entry.is_file(follow_symlinks=False)
+            )
+        total_size = sum(size for _, size in pdf_files)
         manifest_file = download_dir / "MANIFEST.txt"
         
+        lines = [
+            "GALVESTON COUNTY COURT DOCUMENT MANIFEST\n",
+            "=" * 50 + "\n",
+            f"Total Files: {len(pdf_files)}\n",
+            f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Download Directory: {download_dir}\n\n"
+        ]
+        lines.extend(
+            f"{i:2d}. {name}\n    Size: {size:,} bytes\n\n"
+            for i, (name, size) in enumerate(pdf_files, 1)
+        )
+        lines.append(f"TOTAL SIZE: {total_size:,} bytes ({total_size/1024/1024:.1f} MB)\n")
+        
         with open(manifest_file, 'w', encoding='utf-8') as f:
-            f.write("GALVESTON COUNTY COURT DOCUMENT MANIFEST\n")
-            f.write("=" * 50 + "\n")
-            f.write(f"Total Files: {len(pdf_files)}\n")
-            f.write(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Download Directory: {download_dir}\n\n")
-            
-            total_size = 0
-            for i, file in enumerate(pdf_files, 1):
-                size = file.stat().st_size
-                total_size += size
-                f.write(f"{i:2d}. {file.name}\n")
-                f.write(f"    Size: {size:,} bytes\n\n")
-            
-            f.write(f"TOTAL SIZE: {total_size:,} bytes ({total_size/1024/1024:.1f} MB)\n")
+            f.write("".join(lines))
         
         self.log(f"Manifest created: {manifest_file}")
         return manifest_file
@@ -756,18 +1160,18 @@ startxref
             if not navigation_result:
                 return {"success": False, "error": "Navigation failed"}
             
-            html_source, cookies = navigation_result
+            document_rows, cookies = navigation_result
             
             # Parse documents (Phase between navigation and download)
-            self.report_progress(1, 1, "📄 Parsing document information from HTML", "parsing")
-            documents = self.parse_documents(html_source)
+            self.report_progress(1, 1, "📄 Parsing document information", "parsing")
+            documents = self.parse_documents(document_rows)
             if not documents:
                 return {"success": True, "documents": 0, "downloaded": 0, "message": "No documents found"}
             
             # Download documents if directory specified
             download_stats = {"successful": 0, "failed": 0, "skipped": 0, "secured": 0}
             if download_dir:
-                download_stats = self.download_documents(documents, download_dir, cookies)
+                download_stats = self.download_documents(documents, download_dir, cookies, self.max_concurrent)
                 
                 # Create manifest if any files were processed
                 if download_stats["successful"] > 0 or download_stats["secured"] > 0:
@@ -788,13 +1192,126 @@ startxref
             return {"success": False, "error": str(e)}
         
         finally:
-            self.close_driver()
+            # A browser kept open with start() is reused for the next case
+            if not self.keep_browser_open:
+                self.close_driver()
+
+# Scraper owned by each scrape_cases worker process, created by _init_case_worker
+_worker_scraper = None
+_worker_progress_queue = None
+
+def _init_case_worker(headless: bool, progress_queue=None):
+    """Launch the browser a scrape_cases worker process reuses for all its cases"""
+    global _worker_scraper, _worker_progress_queue
+    _worker_progress_queue = progress_queue
+    _worker_scraper = GalvestonCourtScraper(headless=headless)
+    _worker_scraper.start()
+    # Pool workers skip atexit handlers, so close the browser through a multiprocessing finalizer
+    multiprocessing.util.Finalize(_worker_scraper, _worker_scraper.stop, exitpriority=10)
+
+def _scrape_case(case_number: str, download_root: str) -> Tuple[str, Dict]:
+    """Scrape one case inside a scrape_cases worker process"""
+    if _worker_progress_queue is not None:
+        _worker_scraper.progress_callback = lambda data: _worker_progress_queue.put(dict(data, case_number=case_number))
+    download_dir = Path(download_root) / case_number.translate(PATH_SANITIZE)
+    try:
+        return case_number, _worker_scraper.scrape_case(case_number, download_dir)
+    except Exception as e:
+        return case_number, {"success": False, "error": str(e)}
+
+def scrape_cases(case_numbers: List[str], download_root: Path = Path("downloads"), workers: int = 4,
+                 headless: bool = True, progress_queue=None, cases_per_browser: int = 5) -> Dict[str, Dict]:
+    """
+    Scrape several cases in parallel, one browser per worker process
+    
+    Selenium drivers are not thread-safe, so cases run in separate processes
+    that each keep their own Chrome open for the cases they handle. A worker
+    is replaced after cases_per_browser cases so Chrome's memory growth over
+    a long batch is released.
+    
+    Args:
+        case_numbers: Case numbers like '25-CV-0880'
+        download_root: Directory that receives one folder per case
+        workers: Number of worker processes (and browsers)
+        headless: Run the browsers in headless mode
+        progress_queue: Optional multiprocessing.Queue receiving progress
+            dicts tagged with 'case_number'
+        cases_per_browser: Cases a worker handles before it is replaced
+    
+    Returns:
+        Dictionary mapping each case number to its scrape_case result
+    """
+    results = {}
+    if not case_numbers:
+        return results
+    
+    pool = multiprocessing.Pool(processes=max(1, min(workers, len(case_numbers))),
+                                initializer=_init_case_worker,
+                                initargs=(headless, progress_queue),
+                                maxtasksperchild=cases_per_browser)
+    try:
+        for case_number, result in pool.imap_unordered(partial(_scrape_case, download_root=str(download_root)),
+                                                        case_numbers):
+            results[case_number] = result
+        # Let workers exit normally so their finalizers close the browsers
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    
+    return results
+
+def run_batch(cases_file, workers: int, show_browser: bool) -> int:
+    """Scrape every case listed in a file, one case number per line"""
+    case_numbers = list(dict.fromkeys(line.strip() for line in cases_file if line.strip()))
+    if not case_numbers:
+        print("Error: No case numbers found")
+        return 1
+    
+    for case_number in case_numbers:
+        if not CASE_NUMBER_RE.match(case_number):
+            print(f"Warning: Case number '{case_number}' doesn't match expected format")
+    
+    download_root = Path("downloads")
+    print(f"\nProcessing {len(case_numbers)} cases with {workers} browsers")
+    print(f"Download directory: {download_root.absolute()}")
+    print("-" * 40)
+    
+    results = scrape_cases(case_numbers, download_root, workers=workers, headless=not show_browser)
+    
+    # Show results in input order
+    failed = 0
+    for case_number in case_numbers:
+        result = results[case_number]
+        if result["success"]:
+            print(f"✓ {case_number}: {result.get('documents', 0)} documents, {result.get('downloaded', 0)} downloaded")
+        else:
+            failed += 1
+            print(f"✗ {case_number}: {result['error']}")
+    
+    print(f"\n{len(case_numbers) - failed} of {len(case_numbers)} cases processed successfully")
+    return 1 if failed else 0
 
 def main():
     """Main function for command line usage"""
+    parser = argparse.ArgumentParser(description="Download court documents from the Galveston County portal")
+    parser.add_argument("--cases-file", type=argparse.FileType("r"),
+                        help="file with one case number per line ('-' for stdin); scrapes them all in parallel")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="browsers to run at once with --cases-file (default: %(default)s)")
+    parser.add_argument("--show-browser", action="store_true",
+                        help="show the browser windows with --cases-file")
+    args = parser.parse_args()
+    
     print("Galveston County Court Document Scraper")
     print("=" * 50)
     
+    if args.cases_file:
+        with args.cases_file:
+            return run_batch(args.cases_file, max(1, args.workers), args.show_browser)
+    
     # Get case number from user
     case_number = input("Enter case number (e.g., 25-CV-0880): ").strip()
     
@@ -803,7 +1320,7 @@ def main():
         return 1
     
     # Validate case number format
-    if not re.match(r'^\d{2}-[A-Z]{2,3}-\d{3,5}$', case_number):
+    if not CASE_NUMBER_RE.match(case_number):
         print(f"Warning: Case number '{case_number}' doesn't match expected format")
         confirm = input("Continue anyway? (y/n): ").strip().lower()
         if confirm != 'y':
@@ -813,7 +1330,7 @@ def main():
     show_browser = input("Show browser window? (y/n): ").strip().lower() == 'y'
     
     # Setup download directory
-    download_dir = Path("downloads") / case_number.replace('/', '_').replace('\\', '_')
+    download_dir = Path("downloads") / case_number.translate(PATH_SANITIZE)
     
     print(f"\nProcessing case: {case_number}")
     print(f"Download directory: {download_dir}")
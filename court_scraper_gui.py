@@ -6,6 +6,8 @@ Professional interface designed for legal professionals
 
 import os
 import sys
+import queue
+import subprocess
 import threading
 import time
 import json
@@ -13,8 +15,23 @@ from pathlib import Path
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
 
+# Optional faster JSON encoder/decoder for the recent cases file
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import the existing scraper
-from court_scraper import GalvestonCourtScraper
+from court_scraper import GalvestonCourtScraper, CASE_NUMBER_RE, PATH_SANITIZE
+
+# How often queued log lines are flushed into the results log
+LOG_DRAIN_INTERVAL_MS = 100
+
+def _dump_json(data) -> bytes:
+    """Encode data as compact JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
 
 class CourtScraperGUI:
     """Modern GUI for Galveston County Court Document Scraper"""
@@ -37,11 +54,24 @@ class CourtScraperGUI:
         self.scraper = None
         self.download_thread = None
         
+        # Log lines queued by the scraper thread, flushed on the Tk main loop
+        self._log_queue = queue.Queue()
+        
+        # Timestamp text of the last second a log line was formatted in
+        self._ts_epoch = 0
+        self._ts_str = ""
+        
+        # Last progress shown, so repeated updates don't reconfigure the widgets
+        self._last_progress_text = None
+        self._last_progress_pct = -1
+        
         # Create interface
         self.create_widgets()
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
         
         # Load recent cases
         self.recent_cases = self.load_recent_cases()
+        self._saved_recent_cases = _dump_json(self.recent_cases)
         self.update_recent_cases_dropdown()
         
     def create_widgets(self):
@@ -199,17 +229,23 @@ class CourtScraperGUI:
         try:
             recent_file = Path("recent_cases.json")
             if recent_file.exists():
-                with open(recent_file, 'r') as f:
-                    return json.load(f)
+                return (orjson or json).loads(recent_file.read_bytes())
             return []
         except Exception:
             return []
     
     def save_recent_cases(self):
-        """Save recent cases to file"""
+        """Save recent cases to file, skipping the write when nothing changed"""
         try:
-            with open("recent_cases.json", 'w') as f:
-                json.dump(self.recent_cases, f)
+            data = _dump_json(self.recent_cases)
+            if data == self._saved_recent_cases:
+                return
+            
+            # Write a temp file and swap it in so a crash never leaves a truncated file
+            temp_file = Path("recent_cases.json.tmp")
+            temp_file.write_bytes(data)
+            os.replace(temp_file, "recent_cases.json")
+            self._saved_recent_cases = data
         except Exception:
             pass
     
@@ -224,13 +260,14 @@ class CourtScraperGUI:
             self.case_number.set(value)
     
     def add_recent_case(self, case_number):
-        """Add case to recent cases"""
-        if case_number not in self.recent_cases:
-            self.recent_cases.insert(0, case_number)
-            # Keep only last 10 cases
-            self.recent_cases = self.recent_cases[:10]
-            self.update_recent_cases_dropdown()
-            self.save_recent_cases()
+        """Move case to the front of recent cases"""
+        if self.recent_cases and self.recent_cases[0] == case_number:
+            return
+        
+        # Keep only last 10 cases
+        self.recent_cases = [case_number] + [case for case in self.recent_cases if case != case_number][:9]
+        self.update_recent_cases_dropdown()
+        self.save_recent_cases()
     
     def browse_download_location(self):
         """Browse for download location"""
@@ -243,15 +280,29 @@ class CourtScraperGUI:
     
     def log_message(self, message, level="INFO"):
         """Add message to results log"""
-        timestamp = time.strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}\n"
+        # Safe from the download thread; the main loop formats and inserts it in the next batch
+        self._log_queue.put((time.time(), message))
+    
+    def _drain_log_queue(self):
+        """Append all queued log lines to the results log in one update"""
+        pending = []
+        try:
+            while True:
+                timestamp, message = self._log_queue.get_nowait()
+                # Lines logged within the same second share one strftime call
+                now = int(timestamp)
+                if now != self._ts_epoch:
+                    self._ts_epoch = now
+                    self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+                pending.append(f"[{self._ts_str}] {message}\n")
+        except queue.Empty:
+            pass
         
-        # Insert at the end
-        self.results_text.insert("end", formatted_message)
-        self.results_text.see("end")
+        if pending:
+            self.results_text.insert("end", "".join(pending))
+            self.results_text.see("end")
         
-        # Update GUI
-        self.root.update_idletasks()
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
     
     def clear_log(self):
         """Clear the results log"""
@@ -261,21 +312,26 @@ class CourtScraperGUI:
         """Handle progress updates from scraper"""
         try:
             phase = progress_data.get('phase', 'working')
-            step = progress_data.get('step', 0)
-            total_steps = progress_data.get('total_steps', 1)
             message = progress_data.get('message', 'Processing...')
             percentage = progress_data.get('percentage', 0)
             
             # Update progress bar
-            self.progress_bar.set(percentage / 100.0)
+            if percentage != self._last_progress_pct:
+                self.progress_bar.set(percentage / 100.0)
+                self._last_progress_pct = percentage
             
             # Update progress text
             if phase == 'navigation':
-                self.progress_text.configure(text=f"Step {step}/{total_steps}: {message}")
+                text = f"Step {progress_data.get('step', 0)}/{progress_data.get('total_steps', 1)}: {message}"
             elif phase == 'download':
-                self.progress_text.configure(text=f"Downloading: {message}")
+                text = f"Downloading: {message}"
             else:
-                self.progress_text.configure(text=message)
+                text = message
+            
+            if text == self._last_progress_text:
+                return
+            self.progress_text.configure(text=text)
+            self._last_progress_text = text
                 
             # Log the progress
             self.log_message(message)
@@ -285,9 +341,7 @@ class CourtScraperGUI:
     
     def validate_case_number(self, case_num):
         """Validate case number format"""
-        import re
-        pattern = r'^\d{2}-[A-Z]{2,3}-\d{3,5}$'
-        return bool(re.match(pattern, case_num))
+        return CASE_NUMBER_RE.match(case_num) is not None
     
     def start_download(self):
         """Start the download process"""
@@ -315,13 +369,6 @@ class CourtScraperGUI:
             messagebox.showerror("Invalid Input", "Please select a download location.")
             return
         
-        # Create download directory if it doesn't exist
-        try:
-            Path(download_location).mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            messagebox.showerror("Directory Error", f"Cannot create download directory:\n{e}")
-            return
-        
         # Add to recent cases
         self.add_recent_case(case_num)
         
@@ -341,20 +388,31 @@ class CourtScraperGUI:
             
             # Clear previous results
             self.clear_log()
+            self._last_progress_text = None
+            self._last_progress_pct = -1
             
             self.log_message(f"🚀 Starting download for case: {case_number}")
             self.log_message(f"📁 Download location: {download_location}")
             
-            # Create case-specific folder
-            case_folder = Path(download_location) / case_number.replace('/', '_').replace('\\', '_')
-            case_folder.mkdir(parents=True, exist_ok=True)
+            # Create case-specific folder, along with the download directory if it doesn't exist
+            case_folder = Path(download_location) / case_number.translate(PATH_SANITIZE)
+            try:
+                case_folder.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                self.log_message(f"❌ ERROR: Cannot create download directory: {e}")
+                self.progress_text.configure(text="❌ Download failed")
+                self.root.after(0, messagebox.showerror, "Directory Error", f"Cannot create download directory:\n{e}")
+                return
             
-            # Initialize scraper with progress callback
-            self.scraper = GalvestonCourtScraper(
-                headless=True,  # Always run headless for GUI
-                verbose=False,
-                progress_callback=self.progress_callback
-            )
+            # Initialize scraper with progress callback once; its browser stays
+            # open between cases so later downloads skip the Chrome launch
+            if self.scraper is None:
+                self.scraper = GalvestonCourtScraper(
+                    headless=True,  # Always run headless for GUI
+                    verbose=False,
+                    progress_callback=self.progress_callback
+                )
+            self.scraper.start()
             
             # Start scraping
             result = self.scraper.scrape_case(case_number, case_folder)
@@ -402,11 +460,11 @@ class CourtScraperGUI:
         try:
             download_location = self.download_path.get()
             if sys.platform == "darwin":  # macOS
-                os.system(f'open "{download_location}"')
+                subprocess.Popen(["open", download_location])
             elif sys.platform == "win32":  # Windows
                 os.startfile(download_location)
             else:  # Linux
-                os.system(f'xdg-open "{download_location}"')
+                subprocess.Popen(["xdg-open", download_location])
         except Exception as e:
             messagebox.showerror("Error", f"Cannot open folder:\n{e}")
     
@@ -423,7 +481,7 @@ class CourtScraperGUI:
         # Cleanup
         if self.scraper:
             try:
-                self.scraper.close_driver()
+                self.scraper.stop()
             except:
                 pass
         